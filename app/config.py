@@ -30,6 +30,41 @@ class Settings(BaseSettings):
     ----------
     DB_URI: str
         the db uri string.
+    DB_ASYNC: bool
+        use the async engine and AsyncSession instead of the sync ones.
+    DB_REPLICA_URIS: list[str]
+        the db uri strings of the read replicas, as a JSON list.
+    DB_REPLICA_BALANCING: str
+        how reads are spread, round_robin or least_connections.
+    DB_POOL_CLASS: str
+        the connection pool, one of default, queue, null, static
+        or singleton.
+    DB_POOL_SIZE: int
+        the number of connections kept open by a queue pool.
+    DB_MAX_OVERFLOW: int
+        the extra connections a queue pool can open under load.
+    DB_POOL_TIMEOUT: float
+        the seconds to wait for a free connection before failing.
+    DB_POOL_RECYCLE: int
+        the seconds after which connections are replaced, -1 to disable.
+    DB_POOL_PRE_PING: bool
+        test connections for liveness when they are checked out.
+    SQLITE_TUNING: bool
+        apply the SQLITE_* pragmas below to every new SQLite connection.
+    SQLITE_JOURNAL_MODE: str
+        the journal mode, WAL lets readers run while a writer commits.
+    SQLITE_SYNCHRONOUS: str
+        how often SQLite syncs to disk, NORMAL is safe with WAL.
+    SQLITE_BUSY_TIMEOUT: int
+        the milliseconds to wait on a locked database before failing.
+    SQLITE_CACHE_SIZE: int
+        the page cache size, negative values are in KiB.
+    SQLITE_MMAP_SIZE: int
+        the bytes of the database file read through memory mapping.
+    SQLITE_TEMP_STORE: str
+        where temporary tables and indices are kept.
+    METRICS_ENABLED: bool
+        expose the internal metrics endpoints.
     APP_NAME : str
         the app name for the API will show up on docs page.
     DESCRIPTION : str
@@ -45,6 +80,23 @@ class Settings(BaseSettings):
     MAILGUN_DOMAIN: str
     MAILGUN_API_KEY: str
     ALGORITHM: str = "HS256"
+    DB_ASYNC: bool = False
+    DB_REPLICA_URIS: list[str] = []
+    DB_REPLICA_BALANCING: str = "round_robin"
+    DB_POOL_CLASS: str = "default"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+    SQLITE_TUNING: bool = False
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT: int = 5000
+    SQLITE_CACHE_SIZE: int = -64000
+    SQLITE_MMAP_SIZE: int = 268435456
+    SQLITE_TEMP_STORE: str = "MEMORY"
+    METRICS_ENABLED: bool = True
     DESCRIPTION: str = description
     FROM_TITLE: str = "Farmers API"
     APP_NAME: str = "User Management API"
@@ -7,34 +7,301 @@ Classes:
     None
 
 Functions:
+    get_async_url(url):
+        returns the db url with the matching async driver.
+    get_pool_options(url):
+        returns the pool arguments configured for the engine.
+    set_sqlite_pragmas(dbapi_connection, connection_record):
+        applies the configured pragmas to a new SQLite connection.
+    create_db_engine(url):
+        creates the sync or async engine for the db url.
+    create_sessionmaker(engine):
+        creates the session factory for an engine.
+    resolve(result):
+        awaits the result of a session call if it is awaitable.
     get_db():
         the method to return the correct db session depending
         on the instance.
+    get_read_db():
+        returns a session on a read replica, or on the primary
+        when no replicas are configured.
 
 Misc variables:
-    None
+    ASYNC_DRIVERS: dict
+        the async driver to use for each database backend.
+    POOL_CLASSES: dict
+        the pool classes that can be selected by name.
+    SQLITE_PRAGMA_CHOICES: dict
+        the accepted values for the SQLite text pragmas.
+    pool_metrics: dict
+        the live pool metrics for every engine by name.
+    replica_balancer: ReplicaBalancer
+        picks the replica engine for read sessions.
 """
+import inspect
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, pool
+from sqlalchemy.engine import URL, make_url
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 
 from app.config import Settings
+from app.libs.pool_metrics import PoolMetrics
+from app.libs.replica_balancer import ReplicaBalancer
 
 
 settings = Settings()
 
 SQLALCHEMY_DATABASE_URL = settings.DB_URI
 
-engine = create_engine(url=SQLALCHEMY_DATABASE_URL,
-                       connect_args={"check_same_thread": False})
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+    "mysql": "aiomysql",
+}
+
+POOL_CLASSES = {
+    "queue": pool.QueuePool,
+    "null": pool.NullPool,
+    "static": pool.StaticPool,
+    "singleton": pool.SingletonThreadPool,
+}
+
+SQLITE_PRAGMA_CHOICES = {
+    "journal_mode": {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"},
+    "synchronous": {"OFF", "NORMAL", "FULL", "EXTRA"},
+    "temp_store": {"DEFAULT", "FILE", "MEMORY"},
+}
+
+
+def get_async_url(url: str) -> URL:
+    """
+    Returns the db url with the async driver for its backend.
+    Urls that already name an async driver are returned as they are.
+
+    Parameters
+    ----------
+        url: str
+            the db uri string.
+
+    Returns
+    -------
+        URL: the db url using the async driver.
+    """
+    db_url = make_url(url)
+    backend = db_url.get_backend_name()
+
+    if db_url.get_driver_name() in ASYNC_DRIVERS.values():
+        return db_url
+
+    return db_url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+
+
+def get_pool_options(url: str) -> dict:
+    """
+    Returns the pool arguments for the engine from the settings.
+
+    The size, overflow and timeout arguments are only passed to
+    queue pools since the other pool classes do not accept them.
+    SQLite file databases keep the NullPool picked by SQLAlchemy
+    unless another pool class is configured.
+
+    Parameters
+    ----------
+        url: str
+            the db uri string.
+
+    Returns
+    -------
+        dict: the keyword arguments for create_engine.
+    """
+    options = {
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+    pool_class = POOL_CLASSES.get(settings.DB_POOL_CLASS)
 
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    if settings.DB_POOL_CLASS != "default" and pool_class is None:
+        raise ValueError(
+            f"Unknown DB_POOL_CLASS '{settings.DB_POOL_CLASS}'")
+
+    if pool_class is pool.QueuePool and settings.DB_ASYNC:
+        pool_class = pool.AsyncAdaptedQueuePool
+
+    if pool_class is not None:
+        options["poolclass"] = pool_class
+
+    is_sqlite = make_url(url).get_backend_name() == "sqlite"
+
+    if (pool_class is None and not is_sqlite) \
+            or pool_class in (pool.QueuePool, pool.AsyncAdaptedQueuePool):
+        options.update({
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+        })
+
+    return options
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Applies the SQLite tuning pragmas to a newly opened connection.
+    Registered as a connect event listener when SQLITE_TUNING is on.
+
+    Parameters
+    ----------
+        dbapi_connection:
+            the new DBAPI connection.
+        connection_record:
+            the pool record holding the connection.
+
+    Returns
+    -------
+        None
+    """
+    text_pragmas = {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE.upper(),
+        "synchronous": settings.SQLITE_SYNCHRONOUS.upper(),
+        "temp_store": settings.SQLITE_TEMP_STORE.upper(),
+    }
+
+    for name, value in text_pragmas.items():
+        if value not in SQLITE_PRAGMA_CHOICES[name]:
+            raise ValueError(f"Invalid value '{value}' for SQLite {name}")
+
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in text_pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+
+        numeric_pragmas = {
+            "busy_timeout": settings.SQLITE_BUSY_TIMEOUT,
+            "cache_size": settings.SQLITE_CACHE_SIZE,
+            "mmap_size": settings.SQLITE_MMAP_SIZE,
+        }
+
+        for name, value in numeric_pragmas.items():
+            cursor.execute(f"PRAGMA {name}={int(value)}")
+    finally:
+        cursor.close()
+
+
+def create_db_engine(url: str):
+    """
+    Creates the engine for the db url using the configured pool.
+    Returns an async engine when the async mode is selected and
+    installs the SQLite pragmas hook when SQLITE_TUNING is on.
+
+    Parameters
+    ----------
+        url: str
+            the db uri string.
+
+    Returns
+    -------
+        Engine | AsyncEngine: the new engine.
+    """
+    connect_args = {}
+    is_sqlite = make_url(url).get_backend_name() == "sqlite"
+
+    if is_sqlite:
+        connect_args = {"check_same_thread": False}
+
+    if settings.DB_ASYNC:
+        db_engine = create_async_engine(
+            url=get_async_url(url),
+            connect_args=connect_args,
+            **get_pool_options(url))
+    else:
+        db_engine = create_engine(
+            url=url, connect_args=connect_args, **get_pool_options(url))
+
+    if is_sqlite and settings.SQLITE_TUNING:
+        event.listen(
+            getattr(db_engine, "sync_engine", db_engine),
+            "connect",
+            set_sqlite_pragmas)
+
+    return db_engine
+
+
+def create_sessionmaker(engine) -> sessionmaker:
+    """
+    Creates the session factory for the engine, using AsyncSession
+    when the async mode is selected.
+
+    Parameters
+    ----------
+        engine: Engine | AsyncEngine
+            the engine the sessions are bound to.
+
+    Returns
+    -------
+        sessionmaker: the session factory.
+    """
+    if settings.DB_ASYNC:
+        return sessionmaker(
+            bind=engine,
+            class_=AsyncSession,
+            autocommit=False,
+            autoflush=False)
+
+    return sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+
+engine = create_db_engine(SQLALCHEMY_DATABASE_URL)
+
+SessionLocal = create_sessionmaker(engine)
+
+replica_engines = {
+    f"replica_{index}": create_db_engine(uri)
+    for index, uri in enumerate(settings.DB_REPLICA_URIS, start=1)
+}
+
+pool_metrics = {
+    name: PoolMetrics(engine=getattr(db_engine, "sync_engine", db_engine))
+    for name, db_engine in {"primary": engine, **replica_engines}.items()
+}
+
+replica_balancer = ReplicaBalancer(
+    sessionmakers={
+        name: create_sessionmaker(db_engine)
+        for name, db_engine in replica_engines.items()
+    },
+    metrics=pool_metrics,
+    strategy=settings.DB_REPLICA_BALANCING,
+)
 
 Base = declarative_base()
 
 
-def get_db():
+async def resolve(result):
+    """
+    Returns the result of a session call, awaiting it first when
+    the call was made on an AsyncSession.
+
+    This lets the repositories run the same statements on both
+    the sync and the async sessions.
+
+    Parameters
+    ----------
+        result:
+            the value returned by the session method.
+
+    Returns
+    -------
+        the awaited result.
+    """
+    if inspect.isawaitable(result):
+        return await result
+
+    return result
+
+
+async def get_db():
     """
     Returns the current db session depending on the instance.
     Can either be TEST or DEV or LIVE instance.
@@ -45,11 +312,35 @@ def get_db():
 
     Returns
     -------
-        db: Session
+        db: Session | AsyncSession
             the database session.
     """
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
+        await resolve(db.close())
+
+
+async def get_read_db():
+    """
+    Returns a read only session on one of the replicas.
+    Falls back to the primary when no replicas are configured.
+
+    Only use it for endpoints that never write, since replicas
+    may lag behind the primary.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+        db: Session | AsyncSession
+            the database session.
+    """
+    db = replica_balancer.session() if replica_balancer else SessionLocal()
+    try:
+        yield db
+    finally:
+        await resolve(db.close())
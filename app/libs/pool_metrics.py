@@ -0,0 +1,130 @@
+"""
+Contains a utility class to collect live connection pool metrics.
+
+Classes:
+--------
+    PoolMetrics
+
+Functions:
+----------
+    None
+
+Misc Variables:
+--------------
+    None
+"""
+import time
+import threading
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+
+
+class PoolMetrics:
+    """
+    Collects checkout, overflow and wait time counters for the
+    connection pool of an engine.
+
+    Waiting is measured around the pool `connect` call so it covers
+    both the time spent queueing for a free connection and the time
+    spent opening a new one.
+
+    Attributes
+    ----------
+    checkouts: int
+        the number of connections handed out by the pool
+    checked_out: int
+        the number of connections currently in use
+    connections_opened: int
+        the number of new DBAPI connections opened
+    timeouts: int
+        the number of checkouts that gave up waiting
+    wait_time_total: float
+        the total seconds spent waiting for a connection
+    wait_time_max: float
+        the longest wait for a connection in seconds
+
+    Methods
+    -------
+    snapshot():
+        returns the current counters as a dictionary
+    """
+
+    def __init__(self, engine: Engine):
+        self.pool = engine.pool
+        self.checkouts = 0
+        self.checked_out = 0
+        self.connections_opened = 0
+        self.timeouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+        self._lock = threading.Lock()
+
+        event.listen(self.pool, "connect", self._on_connect)
+        event.listen(self.pool, "checkout", self._on_checkout)
+        event.listen(self.pool, "checkin", self._on_checkin)
+
+        connect = self.pool.connect
+
+        def timed_connect():
+            started = time.perf_counter()
+            try:
+                return connect()
+            except exc.TimeoutError:
+                with self._lock:
+                    self.timeouts += 1
+                raise
+            finally:
+                self._record_wait(time.perf_counter() - started)
+
+        self.pool.connect = timed_connect
+
+    def _record_wait(self, waited: float):
+        with self._lock:
+            self.wait_time_total += waited
+            self.wait_time_max = max(self.wait_time_max, waited)
+
+    def _on_connect(self, *args):
+        with self._lock:
+            self.connections_opened += 1
+
+    def _on_checkout(self, *args):
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+
+    def _on_checkin(self, *args):
+        with self._lock:
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def snapshot(self) -> dict:
+        """
+        Returns the current pool counters.
+
+        Parameters:
+        ----------
+            None
+
+        Returns:
+        -------
+            dict:
+                the pool status and counters, wait times in milliseconds.
+        """
+        with self._lock:
+            average = self.wait_time_total / self.checkouts \
+                if self.checkouts else 0.0
+
+            return {
+                "pool_class": type(self.pool).__name__,
+                "size": self.pool.size()
+                if hasattr(self.pool, "size") else None,
+                "overflow": self.pool.overflow()
+                if hasattr(self.pool, "overflow") else None,
+                "checked_out": self.checked_out,
+                "checkouts": self.checkouts,
+                "connections_opened": self.connections_opened,
+                "timeouts": self.timeouts,
+                "wait_time_total_ms": round(self.wait_time_total * 1000, 3),
+                "wait_time_avg_ms": round(average * 1000, 3),
+                "wait_time_max_ms": round(self.wait_time_max * 1000, 3),
+            }
@@ -0,0 +1,99 @@
+"""
+Contains a utility class to spread read sessions across replicas.
+
+Classes:
+--------
+    ReplicaBalancer
+
+Functions:
+----------
+    None
+
+Misc Variables:
+--------------
+    None
+"""
+import threading
+
+from sqlalchemy.orm import sessionmaker
+
+
+class ReplicaBalancer:
+    """
+    Picks the replica that should serve the next read session.
+
+    Attributes
+    ----------
+    sessionmakers: dict[str, sessionmaker]
+        the session factory of every replica by name
+    metrics: dict
+        the pool metrics by name, used to count open connections
+    strategy: str
+        either `round_robin` or `least_connections`
+
+    Methods
+    -------
+    choose():
+        returns the name of the replica to use next
+    session():
+        returns a new session bound to the chosen replica
+    """
+    STRATEGIES = ("round_robin", "least_connections")
+
+    def __init__(
+            self,
+            sessionmakers: dict[str, sessionmaker],
+            metrics: dict,
+            strategy: str = "round_robin"):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown replica balancing '{strategy}'")
+
+        self.sessionmakers = sessionmakers
+        self.metrics = metrics
+        self.strategy = strategy
+        self._names = list(sessionmakers)
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self._names)
+
+    def choose(self) -> str:
+        """
+        Returns the name of the replica that should serve the next read.
+
+        Parameters:
+        ----------
+            None
+
+        Returns:
+        -------
+            str: the replica name
+        """
+        with self._lock:
+            if self.strategy == "least_connections":
+                # ties go to the replica after the last one picked so
+                # idle replicas still share the load evenly.
+                order = self._names[self._next:] + self._names[:self._next]
+                name = min(
+                    order, key=lambda item: self.metrics[item].checked_out)
+            else:
+                name = self._names[self._next]
+
+            self._next = (self._names.index(name) + 1) % len(self._names)
+
+            return name
+
+    def session(self):
+        """
+        Returns a new session bound to the chosen replica.
+
+        Parameters:
+        ----------
+            None
+
+        Returns:
+        -------
+            Session | AsyncSession: the read session
+        """
+        return self.sessionmakers[self.choose()]()
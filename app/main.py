@@ -25,6 +25,7 @@ from app.database import engine
 from app.config import Settings
 from app.auth import router as auth
 from app.users import router as users
+from app.metrics import router as metrics
 from app.value_chains import router as value_chains
 
 
@@ -43,7 +44,16 @@ app.include_router(router=auth.router)
 app.include_router(router=users.router)
 app.include_router(router=value_chains.router)
 
-models.Base.metadata.create_all(bind=engine)
+if settings.METRICS_ENABLED:
+    app.include_router(router=metrics.router)
+
+if settings.DB_ASYNC:
+    @app.on_event("startup")
+    async def create_tables():
+        async with engine.begin() as connection:
+            await connection.run_sync(models.Base.metadata.create_all)
+else:
+    models.Base.metadata.create_all(bind=engine)
 
 
 @app.get("/", tags=["Home"])
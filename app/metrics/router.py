@@ -0,0 +1,49 @@
+"""
+The metrics module router to expose internal runtime counters
+used to size and monitor the deployment.
+
+Classes:
+
+    None
+
+Functions:
+
+    get_metrics():
+        returns the live counters of the running worker.
+
+Misc variables:
+
+    router:
+        the metrics router object, hidden from the public docs.
+"""
+
+from fastapi import APIRouter, status
+
+from app import database
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["Internal"],
+    include_in_schema=False,
+)
+
+
+@router.get("/metrics", status_code=status.HTTP_200_OK)
+async def get_metrics():
+    """
+    Returns the live counters of the worker handling the request.
+
+    Parameters:
+    ----------
+        None
+
+    Returns:
+    -------
+        Dict: the metrics grouped by component
+    """
+    return {
+        "pools": {
+            name: metrics.snapshot()
+            for name, metrics in database.pool_metrics.items()
+        },
+    }
@@ -28,7 +28,7 @@ from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
 
 from app.main import app
-from app.database import Base, get_db
+from app.database import Base, get_db, get_read_db
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 
@@ -53,6 +53,7 @@ def override_get_db():
 
 
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_read_db] = override_get_db
 
 db = TestingSessionLocal()
 client = TestClient(app=app)
@@ -0,0 +1,91 @@
+"""
+Run the repositories against an AsyncSession to make sure every
+query works when the async engine is selected.
+"""
+import pytest
+
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.database import Base, get_async_url
+from app.users import repository, schema
+from app.value_chains import repository as chain_repository
+from app.value_chains import schema as chain_schema
+
+engine = create_async_engine(url=get_async_url("sqlite:///./test_async.db"))
+
+AsyncTestingSessionLocal = sessionmaker(
+    bind=engine, class_=AsyncSession, autocommit=False, autoflush=False)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def test_get_async_url():
+    assert str(get_async_url("sqlite:///./app.db")) == \
+        "sqlite+aiosqlite:///./app.db"
+    assert get_async_url(
+        "postgresql://user@localhost/db").drivername == "postgresql+asyncpg"
+    assert get_async_url(
+        "sqlite+aiosqlite:///./app.db").drivername == "sqlite+aiosqlite"
+
+
+@pytest.mark.anyio
+async def test_async_repository_crud():
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+
+    test_user = schema.UserCreate(
+        first_name="Test",
+        email="async@test.com",
+        password="password",
+    )
+
+    update_user = schema.UserUpdate(
+        first_name="Test",
+        last_name="Doe",
+        middle_name="Test",
+        phone_number="2547XXXXXX",
+        dob="2020-07-10",
+        nationality="",
+    )
+
+    async with AsyncTestingSessionLocal() as db:
+        data = await repository.create_user(db=db, user=test_user)
+
+        assert data.id == 1
+        assert data.email == "async@test.com"
+
+        await chain_repository.create_value_chain(
+            db=db,
+            chain=chain_schema.ValueChainCreate(name="Avocados", user_id=1))
+
+        user_data = await repository.get_by_id(db=db, user_id=1)
+
+        assert user_data.first_name == "Test"
+        assert len(user_data.addresses) == 0
+        assert len(user_data.value_chains) == 1
+
+        user_data = await repository.update_user(
+            db=db, user_id=1, user=update_user)
+
+        assert user_data.last_name == "Doe"
+
+        user_data = await repository.confirm_user(db=db, user_id=1)
+
+        assert user_data.confirmed is True
+
+        users = await repository.get_users(db=db)
+
+        assert len(users) == 1
+
+        await repository.delete_user(db=db, user_id=1)
+
+        assert await repository.get_by_email(
+            db=db, email="async@test.com") is None
+        assert await chain_repository.get_by_id(db=db, chain_id=1) is None
+
+    await engine.dispose()
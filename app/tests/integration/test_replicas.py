@@ -0,0 +1,140 @@
+"""
+Test that the GET user endpoints read from the replicas and
+that writes stay on the primary.
+"""
+import sqlite3
+
+import pytest
+import sqlalchemy
+
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app
+from app.database import get_read_db
+from app.users import repository, schema
+from app.libs.pool_metrics import PoolMetrics
+from app.libs.replica_balancer import ReplicaBalancer
+from app.auth.service import create_access_token
+from app.tests.base_test import client, db, override_get_db
+
+PRIMARY_PATH = "./test.db"
+
+
+def sync_replicas(paths):
+    """
+    Copy the primary database into every replica file.
+    """
+    source = sqlite3.connect(PRIMARY_PATH)
+    for path in paths:
+        target = sqlite3.connect(path)
+        source.backup(target)
+        target.close()
+    source.close()
+
+
+@pytest.fixture
+def replicas(tmp_path):
+    """
+    Build two SQLite replicas kept in sync with the primary and
+    route the read sessions of the app through them.
+    """
+    paths = [str(tmp_path / "replica_1.db"), str(tmp_path / "replica_2.db")]
+    sync_replicas(paths)
+
+    engines = {
+        f"replica_{index}": sqlalchemy.create_engine(
+            url=f"sqlite:///{path}",
+            connect_args={"check_same_thread": False})
+        for index, path in enumerate(paths, start=1)
+    }
+    metrics = {
+        name: PoolMetrics(engine=engine) for name, engine in engines.items()
+    }
+    balancer = ReplicaBalancer(
+        sessionmakers={
+            name: sessionmaker(bind=engine, autocommit=False, autoflush=False)
+            for name, engine in engines.items()
+        },
+        metrics=metrics,
+    )
+
+    def override_get_read_db():
+        session = balancer.session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_read_db] = override_get_read_db
+
+    yield paths, metrics
+
+    app.dependency_overrides[get_read_db] = override_get_db
+
+    for engine in engines.values():
+        engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_reads_use_replicas(replicas):
+    paths, metrics = replicas
+
+    await repository.delete_user(db=db, user_id=1)
+    user = await repository.create_user(db=db, user=schema.UserCreate(
+        first_name="Replica", email="replica@test.com", password="password"))
+    sync_replicas(paths)
+
+    token = create_access_token(data={"sub": user.email})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.get("/users", headers=headers)
+    assert response.status_code == 200, response.text
+    assert [item["email"] for item in response.json()] == [user.email]
+
+    response = client.get(f"/users/{user.id}", headers=headers)
+    assert response.status_code == 200, response.text
+
+    assert metrics["replica_1"].checkouts == 1
+    assert metrics["replica_2"].checkouts == 1
+
+    response = client.put("/users", headers=headers, json={
+        "first_name": "Primary",
+        "middle_name": "",
+        "last_name": "",
+        "dob": "2000-01-01",
+        "nationality": "",
+        "phone_number": "",
+    })
+    assert response.status_code == 200, response.text
+
+    response = client.get(f"/users/{user.id}", headers=headers)
+    assert response.json()["first_name"] == "Replica"
+
+    sync_replicas(paths)
+
+    response = client.get(f"/users/{user.id}", headers=headers)
+    assert response.json()["first_name"] == "Primary"
+
+    await repository.delete_user(db=db, user_id=user.id)
+
+
+def test_least_connections_balancing():
+    class Metrics:
+        def __init__(self, checked_out):
+            self.checked_out = checked_out
+
+    metrics = {"replica_1": Metrics(2), "replica_2": Metrics(0)}
+    balancer = ReplicaBalancer(
+        sessionmakers={"replica_1": None, "replica_2": None},
+        metrics=metrics,
+        strategy="least_connections",
+    )
+
+    assert balancer.choose() == "replica_2"
+
+    metrics["replica_2"].checked_out = 3
+    assert balancer.choose() == "replica_1"
+
+    metrics["replica_1"].checked_out = 3
+    assert balancer.choose() == "replica_2"
+    assert balancer.choose() == "replica_1"
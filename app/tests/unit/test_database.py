@@ -0,0 +1,27 @@
+"""
+Test the engine helpers in the database module.
+"""
+from sqlalchemy import create_engine, event
+
+from app.database import set_sqlite_pragmas
+
+
+def test_set_sqlite_pragmas(tmp_path):
+    """
+    Make sure every tuning pragma is applied to new connections.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'pragmas.db'}")
+    event.listen(engine, "connect", set_sqlite_pragmas)
+
+    with engine.connect() as connection:
+        def pragma(name):
+            return connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+        assert pragma("journal_mode") == "wal"
+        assert pragma("synchronous") == 1
+        assert pragma("busy_timeout") == 5000
+        assert pragma("cache_size") == -64000
+        assert pragma("mmap_size") == 268435456
+        assert pragma("temp_store") == 2
+
+    engine.dispose()
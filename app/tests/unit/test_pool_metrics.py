@@ -0,0 +1,55 @@
+"""
+Test the connection pool metrics and the internal endpoint
+that exposes them.
+"""
+import pytest
+
+from sqlalchemy import create_engine, exc, pool
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.libs.pool_metrics import PoolMetrics
+
+
+client = TestClient(app=app)
+
+
+def test_pool_metrics_counters():
+    """
+    Check out connections until the pool is exhausted and make sure
+    the checkouts, overflow and timeouts are all counted.
+    """
+    engine = create_engine(
+        "sqlite://",
+        poolclass=pool.QueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.01,
+    )
+    metrics = PoolMetrics(engine=engine)
+
+    first = engine.connect()
+    second = engine.connect()
+
+    data = metrics.snapshot()
+    assert data["pool_class"] == "QueuePool"
+    assert data["checked_out"] == 2
+    assert data["overflow"] == 1
+    assert data["checkouts"] == 2
+
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+
+    first.close()
+    second.close()
+
+    data = metrics.snapshot()
+    assert data["checked_out"] == 0
+    assert data["timeouts"] == 1
+    assert data["wait_time_max_ms"] >= 10
+
+
+def test_metrics_endpoint():
+    response = client.get(url="/internal/metrics")
+    assert response.status_code == 200, response.text
+    assert "primary" in response.json()["pools"]
@@ -17,10 +17,13 @@ Misc variables:
         endpoint methods.
 """
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update, delete
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import models
 from app.users import schema
+from app.database import resolve
 
 
 async def get_users(
@@ -42,7 +45,10 @@ async def get_users(
             list[User]:
                 the app users existing in the db.
     """
-    return db.query(models.User).offset(skip).limit(limit).all()
+    result = await resolve(db.execute(
+        select(models.User).offset(skip).limit(limit)))
+
+    return result.scalars().all()
 
 
 async def create_user(
@@ -64,8 +70,8 @@ async def create_user(
     """
     new_user = models.User(**user.dict())
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await resolve(db.commit())
+    await resolve(db.refresh(new_user))
     return new_user
 
 
@@ -85,8 +91,18 @@ async def get_by_id(db: Session, user_id: int) -> models.User | None:
         User: the user details
         None: if the user is not found.
     """
-    user: models.User | None = db.query(models.User).filter(
-        models.User.id == user_id).first()
+    statement = select(models.User).where(models.User.id == user_id)
+
+    if isinstance(db, AsyncSession):
+        # async sessions cannot lazy load the collections that
+        # UserDetailsShow reads once the request has returned.
+        statement = statement.options(
+            selectinload(models.User.addresses),
+            selectinload(models.User.value_chains),
+        )
+
+    result = await resolve(db.execute(statement))
+    user: models.User | None = result.scalars().first()
 
     return user
 
@@ -107,8 +123,9 @@ async def get_by_email(db: Session, email: str) -> models.User | None:
         User: the user details
         None: if the user is not found.
     """
-    user: models.User | None = db.query(models.User).filter(
-        models.User.email == email).first()
+    result = await resolve(db.execute(
+        select(models.User).where(models.User.email == email)))
+    user: models.User | None = result.scalars().first()
 
     return user
 
@@ -135,10 +152,13 @@ async def update_user(
         User:
             the updated user details
     """
-    db.query(models.User).filter(models.User.id ==
-                                 user_id).update({**user.dict()},
-                                                 synchronize_session=False)
-    db.commit()
+    await resolve(db.execute(
+        update(models.User)
+        .where(models.User.id == user_id)
+        .values(**user.dict())
+        .execution_options(synchronize_session=False)))
+
+    await resolve(db.commit())
 
     return await get_by_id(db=db, user_id=user_id)
 
@@ -159,11 +179,13 @@ async def confirm_user(db: Session, user_id: int) -> models.User:
         User:
             the updated user details
     """
-    db.query(models.User).filter(
-        models.User.id == user_id).update({
-            "confirmed": True}, synchronize_session=False)
+    await resolve(db.execute(
+        update(models.User)
+        .where(models.User.id == user_id)
+        .values(confirmed=True)
+        .execution_options(synchronize_session=False)))
 
-    db.commit()
+    await resolve(db.commit())
 
     return await get_by_id(db=db, user_id=user_id)
 
@@ -183,19 +205,22 @@ async def delete_user(db: Session, user_id: int) -> None:
     -------
         None
     """
-    db.query(models.UserAddress).filter(
-        models.UserAddress.user_id == user_id
-    ).delete(synchronize_session=False)
+    await resolve(db.execute(
+        delete(models.UserAddress)
+        .where(models.UserAddress.user_id == user_id)
+        .execution_options(synchronize_session=False)))
 
-    db.query(models.ValueChain).filter(
-        models.ValueChain.user_id == user_id
-    ).delete(synchronize_session=False)
+    await resolve(db.execute(
+        delete(models.ValueChain)
+        .where(models.ValueChain.user_id == user_id)
+        .execution_options(synchronize_session=False)))
 
-    db.query(models.User).filter(
-        models.User.id == user_id
-    ).delete(synchronize_session=False)
+    await resolve(db.execute(
+        delete(models.User)
+        .where(models.User.id == user_id)
+        .execution_options(synchronize_session=False)))
 
-    db.commit()
+    await resolve(db.commit())
 
     return
 
@@ -218,8 +243,8 @@ async def create_address(
     """
     new_address = models.UserAddress(**address.dict())
     db.add(new_address)
-    db.commit()
-    db.refresh(new_address)
+    await resolve(db.commit())
+    await resolve(db.refresh(new_address))
     return new_address
 
 
@@ -240,8 +265,9 @@ async def get_address_by_id(
         UserAddress: the address details
         None: if the address is not found.
     """
-    address: models.UserAddress | None = db.query(models.UserAddress).filter(
-        models.UserAddress.id == addr_id).first()
+    result = await resolve(db.execute(
+        select(models.UserAddress).where(models.UserAddress.id == addr_id)))
+    address: models.UserAddress | None = result.scalars().first()
 
     return address
 
@@ -267,11 +293,13 @@ async def update_address(
     -------
         UserAddress: the updated address details
     """
-    db.query(models.UserAddress).filter(
-        models.UserAddress.id == addr_id).update(
-            {**address.dict()}, synchronize_session=False)
+    await resolve(db.execute(
+        update(models.UserAddress)
+        .where(models.UserAddress.id == addr_id)
+        .values(**address.dict())
+        .execution_options(synchronize_session=False)))
 
-    db.commit()
+    await resolve(db.commit())
 
     return await get_address_by_id(db=db, addr_id=addr_id)
 
@@ -291,9 +319,11 @@ async def delete_address(db: Session, addr_id: int) -> None:
     -------
         None
     """
-    db.query(models.UserAddress).filter(
-        models.UserAddress.id == addr_id).delete(synchronize_session=False)
+    await resolve(db.execute(
+        delete(models.UserAddress)
+        .where(models.UserAddress.id == addr_id)
+        .execution_options(synchronize_session=False)))
 
-    db.commit()
+    await resolve(db.commit())
 
     return
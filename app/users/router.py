@@ -25,6 +25,7 @@ from app.users import service, schema
 from app.auth.service import get_current_user
 
 get_db = database.get_db
+get_read_db = database.get_read_db
 
 router = APIRouter(prefix="/users")
 
@@ -37,7 +38,7 @@ async def get_users(
     skip: int = 0,
     limit: int = 100,
     _=Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ) -> list[schema.UserShow]:
     """
     Returns existing users list paginated as defined. 
@@ -64,7 +65,7 @@ async def get_users(
 async def get_user(
         user_id: int,
         _=Depends(get_current_user),
-        db: Session = Depends(get_db)):
+        db: Session = Depends(get_read_db)):
     """
     Get user details.
 
@@ -16,10 +16,12 @@ Misc variables:
     None
 """
 
+from sqlalchemy import select, update, delete
 from sqlalchemy.orm import Session
 
 from app import models
 from app.value_chains import schema
+from app.database import resolve
 
 
 async def create_value_chain(
@@ -42,8 +44,8 @@ async def create_value_chain(
     """
     new_chain = models.ValueChain(**chain.dict())
     db.add(new_chain)
-    db.commit()
-    db.refresh(new_chain)
+    await resolve(db.commit())
+    await resolve(db.refresh(new_chain))
     return new_chain
 
 
@@ -63,8 +65,9 @@ async def get_by_id(db: Session, chain_id: int) -> models.ValueChain | None:
         ValueChain: the value_chain details
         None: if the value_chain is not found.
     """
-    chain: models.ValueChain | None = db.query(models.ValueChain).filter(
-        models.ValueChain.id == chain_id).first()
+    result = await resolve(db.execute(
+        select(models.ValueChain).where(models.ValueChain.id == chain_id)))
+    chain: models.ValueChain | None = result.scalars().first()
 
     return chain
 
@@ -91,11 +94,13 @@ async def update_value_chain(
         ValueChain:
             the updated value chain details
     """
-    db.query(models.ValueChain).filter(
-        models.ValueChain.id == chain_id).update({
-            **chain.dict()}, synchronize_session=False)
+    await resolve(db.execute(
+        update(models.ValueChain)
+        .where(models.ValueChain.id == chain_id)
+        .values(**chain.dict())
+        .execution_options(synchronize_session=False)))
 
-    db.commit()
+    await resolve(db.commit())
 
     return await get_by_id(db=db, chain_id=chain_id)
 
@@ -115,9 +120,11 @@ async def delete_value_chain(db: Session, chain_id: int) -> None:
     -------
         None
     """
-    db.query(models.ValueChain).filter(
-        models.ValueChain.id == chain_id).delete(synchronize_session=False)
+    await resolve(db.execute(
+        delete(models.ValueChain)
+        .where(models.ValueChain.id == chain_id)
+        .execution_options(synchronize_session=False)))
 
-    db.commit()
+    await resolve(db.commit())
 
     return
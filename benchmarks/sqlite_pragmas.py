@@ -0,0 +1,145 @@
+"""
+Benchmark concurrent reads and writes on the /users endpoints with
+and without the SQLite tuning mode (SQLITE_TUNING).
+
+Every worker process imports the app on its own, the same way the
+gunicorn workers do, and shares a single SQLite file with the others.
+Readers call GET /users while writers call PUT /users.
+
+Usage:
+
+    python benchmarks/sqlite_pragmas.py --readers 4 --writers 2 --seconds 10
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import multiprocessing
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+BASE_ENV = {
+    "SECRET_KEY": "benchmark",
+    "FROM_EMAIL": "bench@example.com",
+    "MAILGUN_DOMAIN": "example.com",
+    "MAILGUN_API_KEY": "benchmark",
+}
+
+UPDATE = {
+    "first_name": "Bench",
+    "middle_name": "Mark",
+    "last_name": "User",
+    "dob": "2000-01-01",
+    "nationality": "Kenyan",
+    "phone_number": "",
+}
+
+
+def seed(db_uri: str, users: int):
+    os.environ.update(BASE_ENV, DB_URI=db_uri)
+
+    from app import models
+    from app.database import engine, SessionLocal
+
+    models.Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    db.add_all([
+        models.User(email=f"user{i}@example.com", first_name="Bench")
+        for i in range(users)
+    ])
+    db.commit()
+    db.close()
+    engine.dispose()
+
+
+def worker(db_uri, tuning, role, index, seconds, results):
+    os.environ.update(
+        BASE_ENV, DB_URI=db_uri, SQLITE_TUNING=str(tuning))
+
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+    from app.auth.service import create_access_token
+
+    token = create_access_token(data={"sub": f"user{index}@example.com"})
+    client = TestClient(app=app)
+    client.headers["Authorization"] = f"Bearer {token}"
+
+    done = errors = 0
+    deadline = time.perf_counter() + seconds
+
+    while time.perf_counter() < deadline:
+        try:
+            if role == "read":
+                response = client.get("/users?limit=50")
+            else:
+                response = client.put("/users", json=UPDATE)
+
+            if response.status_code == 200:
+                done += 1
+            else:
+                errors += 1
+        except Exception:
+            errors += 1
+
+    results.put((role, done, errors))
+
+
+def run(tuning: bool, args) -> dict:
+    directory = tempfile.mkdtemp()
+    db_uri = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+
+    context = multiprocessing.get_context("spawn")
+    seeder = context.Process(
+        target=seed, args=(db_uri, args.readers + args.writers))
+    seeder.start()
+    seeder.join()
+
+    results = context.Queue()
+    roles = ["read"] * args.readers + ["write"] * args.writers
+    processes = [
+        context.Process(
+            target=worker,
+            args=(db_uri, tuning, role, index, args.seconds, results))
+        for index, role in enumerate(roles)
+    ]
+
+    for process in processes:
+        process.start()
+
+    totals = {"read": [0, 0], "write": [0, 0]}
+    for _ in processes:
+        role, done, errors = results.get()
+        totals[role][0] += done
+        totals[role][1] += errors
+
+    for process in processes:
+        process.join()
+
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+
+    print(f"{'mode':<8}{'reads/s':>10}{'writes/s':>10}"
+          f"{'read err':>10}{'write err':>10}")
+
+    for tuning in (False, True):
+        totals = run(tuning=tuning, args=args)
+        print(f"{'tuned' if tuning else 'default':<8}"
+              f"{totals['read'][0] / args.seconds:>10.1f}"
+              f"{totals['write'][0] / args.seconds:>10.1f}"
+              f"{totals['read'][1]:>10}"
+              f"{totals['write'][1]:>10}")
+
+
+if __name__ == "__main__":
+    main()
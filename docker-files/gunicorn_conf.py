@@ -35,6 +35,11 @@ use_errorlog = errorlog_var or None
 graceful_timeout_str = os.getenv("GRACEFUL_TIMEOUT", "120")
 timeout_str = os.getenv("TIMEOUT", "120")
 keepalive_str = os.getenv("KEEP_ALIVE", "5")
+db_pool_size = int(os.getenv("DB_POOL_SIZE", "5"))
+db_max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+# Every worker owns its own pool, so this is the worst case number of
+# connections the database has to accept from this deployment.
+db_max_connections = web_concurrency * (db_pool_size + db_max_overflow)
 
 # Gunicorn config variables
 loglevel = use_loglevel
@@ -63,5 +68,8 @@ log_data = {
     "use_max_workers": use_max_workers,
     "host": host,
     "port": port,
+    "db_pool_size": db_pool_size,
+    "db_max_overflow": db_max_overflow,
+    "db_max_connections": db_max_connections,
 }
 print(json.dumps(log_data))